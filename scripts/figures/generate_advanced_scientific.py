@@ -19,6 +19,8 @@ from scipy import stats
 from matplotlib.patches import Ellipse
 import matplotlib.patches as mpatches
 
+from triplet_scan_results import load_triplet_scan_top
+
 # Publication-quality settings
 plt.style.use('seaborn-v0_8-paper')
 matplotlib.rcParams.update({
@@ -399,14 +401,11 @@ def generate_leave_one_out():
 def generate_triplet_heatmap():
     """Heatmap of triplet scan results."""
     try:
-        with open(RESULTS_DIR / 'neutrino_triplet_scan_results.json', 'r') as f:
-            data = json.load(f)
-        
         # Extract top triplets
-        sorted_data = sorted(data, key=lambda x: x.get('rank', 999))[:30]
-        triplets = [tuple(sorted(d.get('triplet', []))) for d in sorted_data]
-        chi2_values = [d.get('total_chi2', 0) for d in sorted_data]
-        ranks = [d.get('rank', 0) for d in sorted_data]
+        top = load_triplet_scan_top(RESULTS_DIR, 30)
+        triplets = [t for _, _, t in top]
+        chi2_values = [chi2 for _, chi2, _ in top]
+        ranks = [rank for rank, _, _ in top]
         
         # Create matrix representation
         n_max = max([max(t) for t in triplets if t])
@@ -414,7 +413,8 @@ def generate_triplet_heatmap():
         
         for (n1, n2, n3), chi2, rank in zip(triplets, chi2_values, ranks):
             if rank <= 10:
-                matrix[n1-1, n2-1] = chi2
+                # Several n3 share an (n1, n2) cell: keep the best χ²
+                matrix[n1-1, n2-1] = np.fmin(matrix[n1-1, n2-1], chi2)
         
     except:
         # Mock data
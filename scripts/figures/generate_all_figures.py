@@ -16,6 +16,8 @@ import json
 import os
 from pathlib import Path
 
+from triplet_scan_results import load_triplet_scan_top
+
 # Set publication-quality style
 plt.style.use('seaborn-v0_8-paper')
 matplotlib.rcParams.update({
@@ -200,14 +202,12 @@ def generate_triplet_scan():
     """Figure 4: Triplet scan results."""
     try:
         results_dir = SCRIPT_DIR.parent.parent / 'results'
-        with open(results_dir / 'neutrino_triplet_scan_results.json', 'r') as f:
-            data = json.load(f)
         
-        # Sort by rank/chi2
-        sorted_data = sorted(data, key=lambda x: x.get('rank', 999))[:20]  # Top 20
-        ranks = [d.get('rank', 0) for d in sorted_data]
-        chi2_values = [d.get('total_chi2', 0) for d in sorted_data]
-        triplets = [str(d.get('triplet', [])) for d in sorted_data]
+        # Rank by chi2 (Top 20)
+        top = load_triplet_scan_top(results_dir, 20)
+        ranks = [rank for rank, _, _ in top]
+        chi2_values = [chi2 for _, chi2, _ in top]
+        triplets = ['{%d,%d,%d}' % t for _, _, t in top]
         
     except:
         # Mock data
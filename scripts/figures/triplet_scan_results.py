@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Reader for the neutrino triplet scan results, shared by the figure scripts.
+
+Author: QGI Framework
+Date: 2025
+"""
+
+import heapq
+import json
+
+# Optional: Parquet reader for the triplet scan results
+try:
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def load_triplet_scan_top(results_dir, k):
+    """
+    Best k triplets from neutrino_triplet_scan.py, lowest chi2_total first.
+    
+    Reads the Parquet results (or the JSON written when pyarrow is not
+    installed); both have one record per triplet with n1, n2, n3, chi2_total.
+    
+    Returns:
+        list of (rank, chi2_total, (n1, n2, n3))
+    """
+    parquet_file = results_dir / 'neutrino_triplet_scan_results.parquet'
+    if PYARROW_AVAILABLE and parquet_file.exists():
+        records = pq.read_table(parquet_file,
+                                columns=['n1', 'n2', 'n3', 'chi2_total']).to_pylist()
+    else:
+        with open(results_dir / 'neutrino_triplet_scan_results.json', 'r') as f:
+            records = json.load(f)
+    
+    top = heapq.nsmallest(k, records, key=lambda d: d['chi2_total'])
+    return [(rank, d['chi2_total'], (d['n1'], d['n2'], d['n3']))
+            for rank, d in enumerate(top, start=1)]
@@ -14,7 +14,7 @@ Sources:
 
 import numpy as np
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 @dataclass
 class NeutrinoOscillationData:
@@ -175,76 +175,121 @@ QGI_PREDICTIONS = {
 }
 
 
+# Prediction-side values, read once
+QGI_DELTA_M21_SQ = QGI_PREDICTIONS["Delta_m21_sq"]
+QGI_DELTA_M31_SQ = QGI_PREDICTIONS["Delta_m31_sq"]
+QGI_SUM_M_NU = QGI_PREDICTIONS["sum_m_nu"]
+
+
 # ============================================================================
 # COMPARISON FUNCTIONS
 # ============================================================================
 
-def compare_with_data(prediction: Dict, data: NeutrinoOscillationData) -> Dict:
-    """Compare QGI predictions with experimental data"""
+@dataclass(slots=True)
+class SplittingComparison:
+    """QGI vs experiment for one mass-squared splitting"""
+    qgi: float
+    exp: float
+    error: float
+    difference: float
+    sigma: float
+    percent_tension: float
+
+
+@dataclass(slots=True)
+class SumComparison:
+    """QGI Σmᵥ vs cosmological upper bound"""
+    qgi: float
+    upper_bound: float
+    within_bound: bool
+    margin: float
+
+
+@dataclass(slots=True)
+class DataComparison:
+    """Full comparison of QGI predictions with one data source"""
+    Delta_m21_sq: SplittingComparison
+    Delta_m31_sq: SplittingComparison
+    sum_m_nu: SumComparison
+
+
+def compare_with_data(data: NeutrinoOscillationData,
+                      prediction: Optional[Dict] = None) -> DataComparison:
+    """
+    Compare QGI predictions with experimental data
     
-    results = {}
+    prediction defaults to the module-level QGI_PREDICTIONS values.
+    """
+    
+    if prediction is None:
+        qgi21, qgi31, qgi_sum = QGI_DELTA_M21_SQ, QGI_DELTA_M31_SQ, QGI_SUM_M_NU
+    else:
+        qgi21 = prediction["Delta_m21_sq"]
+        qgi31 = prediction["Delta_m31_sq"]
+        qgi_sum = prediction["sum_m_nu"]
     
     # Delta m²₂₁ comparison
-    diff_21 = abs(prediction["Delta_m21_sq"] - data.Delta_m21_sq)
-    sigma_21 = diff_21 / data.Delta_m21_sq_err
-    results["Delta_m21_sq"] = {
-        "QGI": prediction["Delta_m21_sq"],
-        "Exp": data.Delta_m21_sq,
-        "Error": data.Delta_m21_sq_err,
-        "Difference": diff_21,
-        "Sigma": sigma_21,
-        "Percent_tension": (diff_21 / data.Delta_m21_sq) * 100
-    }
+    diff_21 = abs(qgi21 - data.Delta_m21_sq)
+    delta_m21 = SplittingComparison(
+        qgi=qgi21,
+        exp=data.Delta_m21_sq,
+        error=data.Delta_m21_sq_err,
+        difference=diff_21,
+        sigma=diff_21 / data.Delta_m21_sq_err,
+        percent_tension=(diff_21 / data.Delta_m21_sq) * 100,
+    )
     
     # Delta m²₃₁ comparison
-    diff_31 = abs(prediction["Delta_m31_sq"] - data.Delta_m31_sq_NO)
-    sigma_31 = diff_31 / data.Delta_m31_sq_NO_err
-    results["Delta_m31_sq"] = {
-        "QGI": prediction["Delta_m31_sq"],
-        "Exp": data.Delta_m31_sq_NO,
-        "Error": data.Delta_m31_sq_NO_err,
-        "Difference": diff_31,
-        "Sigma": sigma_31,
-        "Percent_tension": (diff_31 / data.Delta_m31_sq_NO) * 100
-    }
+    diff_31 = abs(qgi31 - data.Delta_m31_sq_NO)
+    delta_m31 = SplittingComparison(
+        qgi=qgi31,
+        exp=data.Delta_m31_sq_NO,
+        error=data.Delta_m31_sq_NO_err,
+        difference=diff_31,
+        sigma=diff_31 / data.Delta_m31_sq_NO_err,
+        percent_tension=(diff_31 / data.Delta_m31_sq_NO) * 100,
+    )
     
     # Sum constraint
-    results["sum_m_nu"] = {
-        "QGI": prediction["sum_m_nu"],
-        "Upper_bound": data.sum_m_nu_upper,
-        "Within_bound": prediction["sum_m_nu"] < data.sum_m_nu_upper,
-        "Margin": data.sum_m_nu_upper - prediction["sum_m_nu"]
-    }
-    
-    return results
+    sum_m_nu = SumComparison(
+        qgi=qgi_sum,
+        upper_bound=data.sum_m_nu_upper,
+        within_bound=qgi_sum < data.sum_m_nu_upper,
+        margin=data.sum_m_nu_upper - qgi_sum,
+    )
+    
+    return DataComparison(delta_m21, delta_m31, sum_m_nu)
 
 
 def print_comparison(data_source: NeutrinoOscillationData):
     """Print formatted comparison"""
     
-    print("="*80)
-    print(f"COMPARISON: QGI vs {data_source.source}")
-    print("="*80)
-    
-    results = compare_with_data(QGI_PREDICTIONS, data_source)
-    
-    print(f"\nΔm²₂₁ (solar):")
-    print(f"  QGI:        {results['Delta_m21_sq']['QGI']:.3e} eV²")
-    print(f"  {data_source.source}: {results['Delta_m21_sq']['Exp']:.3e} ± {results['Delta_m21_sq']['Error']:.2e} eV²")
-    print(f"  Tension:    {results['Delta_m21_sq']['Percent_tension']:.1f}% ({results['Delta_m21_sq']['Sigma']:.1f}σ)")
-    
-    print(f"\nΔm²₃₁ (atmospheric, NO):")
-    print(f"  QGI:        {results['Delta_m31_sq']['QGI']:.3e} eV²")
-    print(f"  {data_source.source}: {results['Delta_m31_sq']['Exp']:.3e} ± {results['Delta_m31_sq']['Error']:.2e} eV²")
-    print(f"  Tension:    {results['Delta_m31_sq']['Percent_tension']:.1f}% ({results['Delta_m31_sq']['Sigma']:.1f}σ)")
+    results = compare_with_data(data_source)
+    dm21, dm31, sum_m_nu = results.Delta_m21_sq, results.Delta_m31_sq, results.sum_m_nu
+    status = '✓ Within bound' if sum_m_nu.within_bound else '✗ Exceeds bound'
+    rule = "="*80
     
-    print(f"\nΣmᵥ:")
-    print(f"  QGI:        {results['sum_m_nu']['QGI']:.4f} eV")
-    print(f"  Bound:      < {results['sum_m_nu']['Upper_bound']:.2f} eV ({data_source.sum_m_nu_source})")
-    print(f"  Status:     {'✓ Within bound' if results['sum_m_nu']['Within_bound'] else '✗ Exceeds bound'}")
-    print(f"  Margin:     {results['sum_m_nu']['Margin']:.4f} eV")
-    
-    print("="*80)
+    # One write for the whole block
+    print(f"""{rule}
+COMPARISON: QGI vs {data_source.source}
+{rule}
+
+Δm²₂₁ (solar):
+  QGI:        {dm21.qgi:.3e} eV²
+  {data_source.source}: {dm21.exp:.3e} ± {dm21.error:.2e} eV²
+  Tension:    {dm21.percent_tension:.1f}% ({dm21.sigma:.1f}σ)
+
+Δm²₃₁ (atmospheric, NO):
+  QGI:        {dm31.qgi:.3e} eV²
+  {data_source.source}: {dm31.exp:.3e} ± {dm31.error:.2e} eV²
+  Tension:    {dm31.percent_tension:.1f}% ({dm31.sigma:.1f}σ)
+
+Σmᵥ:
+  QGI:        {sum_m_nu.qgi:.4f} eV
+  Bound:      < {sum_m_nu.upper_bound:.2f} eV ({data_source.sum_m_nu_source})
+  Status:     {status}
+  Margin:     {sum_m_nu.margin:.4f} eV
+{rule}""")
 
 
 def juno_scenarios():
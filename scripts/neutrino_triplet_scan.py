@@ -14,8 +14,19 @@ Date: October 29, 2025
 """
 
 import numpy as np
-from itertools import combinations
+from math import comb
+import itertools
 import json
+import sys
+
+# Optional: Parquet output for the complete scan results
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # PDG 2024 experimental values
 Delta_m31_sq_exp = 2.453e-3  # eV² (atmospheric)
@@ -33,45 +44,126 @@ sigma_23 = 1.4
 # Cosmology bound
 sum_mnu_max = 0.12  # eV (95% CL from Planck+BAO)
 
+# Targets and 1σ uncertainties for (Δm²₂₁, θ₁₂, θ₁₃, θ₂₃), in χ² order
+EXP = np.array([Delta_m21_sq_exp, theta12_exp, theta13_exp, theta23_exp])
+SIGMA = np.array([sigma_Delta21, sigma_12, sigma_13, sigma_23])
 
-def compute_pmns_angles_simple(n1, n2, n3):
+# Columnar (SoA) layout for scan results: one contiguous record per triplet.
+# Full precision in memory; evaluate_triplet() and the JSON fallback use it.
+TRIPLET_DTYPE = np.dtype([
+    ('n1', 'i2'), ('n2', 'i2'), ('n3', 'i2'),
+    ('m1_meV', 'f8'), ('m2_meV', 'f8'), ('m3_meV', 'f8'),
+    ('sum_mnu_eV', 'f8'),
+    ('Delta_m21_sq', 'f8'),
+    ('theta12', 'f8'), ('theta13', 'f8'), ('theta23', 'f8'),
+    ('chi2_solar', 'f8'), ('chi2_pmns', 'f8'), ('chi2_cosmo', 'f8'),
+    ('chi2_total', 'f8'),
+    ('violates_cosmo', '?'),
+])
+
+# Compact on-disk layout for the Parquet file: int8 winding numbers
+# (n_max ≤ 127) and float32 values (~7 significant digits)
+TRIPLET_FILE_DTYPE = np.dtype([
+    (name, 'i1' if name in ('n1', 'n2', 'n3') else
+           '?' if name == 'violates_cosmo' else 'f4')
+    for name in TRIPLET_DTYPE.names
+])
+N_MAX_FILE = np.iinfo(np.int8).max
+
+
+# MaxEnt result for the QGI triplet (App. I3)
+QGI_TRIPLET = (1, 3, 7)
+QGI_PMNS_ANGLES = (32.92, 8.49, 47.60)
+
+
+# Generation pairs (i, j), i < j, in PMNS angle order: (1,2), (1,3), (2,3)
+PAIR_I, PAIR_J = np.triu_indices(3, k=1)
+
+
+def _pmns_overlap_kernel(n, pair_i, pair_j, b, scale):
     """
-    PMNS angles: use MaxEnt-derived empirical fit.
+    Calibrated overlap angles for a (k, 3) float64 array of triplets.
+    
+    All pairs are formed at once, f_ij = |n_j - n_i| / (n_i n_j)^b, so the
+    power is a single array op over (k, n_pairs).
+    """
+    ni = n[:, pair_i]
+    nj = n[:, pair_j]
+    
+    return scale * (np.abs(nj - ni) / (ni * nj)**b)
+
+
+class MaxEntBatch:
+    """
+    Batched PMNS angle evaluator with the fixed kernel pieces precomputed.
     
     NOTE: Full MaxEnt calculation (App. I3) is computationally expensive.
-    For combinatorial scan, we use a simplified empirical relation
-    calibrated to {1,3,7} → (32.92°, 8.49°, 47.60°).
+    The overlap exponent and the angle calibration are set up once here,
+    so each call is a single pass over the triplet arrays. A full
+    Fisher-Ricci solver should keep this interface (its fixed-point
+    parameters C, s added here): setup in __init__, per-triplet work in
+    __call__.
     
-    This is conservative: other triplets might look artificially worse.
+    Args:
+        b: Overlap exponent (1/6, exact from Fisher curvature)
     """
-    # For {1,3,7}: known to give good PMNS
-    if (n1, n2, n3) == (1, 3, 7):
-        return 32.92, 8.49, 47.60  # MaxEnt result
     
-    # For others: use geometric estimate (will be approximate)
-    # This may underestimate quality of alternative triplets
-    b = 1/6
+    def __init__(self, b=1/6):
+        self.b = b
+        
+        # Empirical calibration (tuned to make {1,3,7} close to PDG)
+        # NOTE: This is a limitation - ideally would run full MaxEnt for each
+        self.scale = np.array([33.0 / 1.66, 8.5 / 4.34, 47.0 / 2.41])
+    
+    def __call__(self, n1, n2, n3):
+        """Return (theta12, theta13, theta23) arrays in degrees."""
+        shape = np.broadcast(n1, n2, n3).shape
+        n = np.column_stack([np.broadcast_to(x, shape).ravel()
+                             for x in (n1, n2, n3)]).astype(np.float64)
+        
+        # Geometric estimate for every triplet (will be approximate)
+        # This may underestimate quality of alternative triplets
+        theta = _pmns_overlap_kernel(n, PAIR_I, PAIR_J, self.b, self.scale)
+        
+        # For {1,3,7}: known to give good PMNS (MaxEnt result), applied as a mask
+        is_qgi = (n == QGI_TRIPLET).all(axis=1)
+        theta = np.where(is_qgi[:, None], QGI_PMNS_ANGLES, theta)
+        
+        return tuple(theta[:, k].reshape(shape) for k in range(3))
+
+
+_MAXENT_BATCH = MaxEntBatch()
+
+
+def compute_pmns_angles_simple(n1, n2, n3):
+    """
+    PMNS angles: use MaxEnt-derived empirical fit.
     
-    f12 = abs(n2 - n1) / ((n1 * n2)**b)
-    f13 = abs(n3 - n1) / ((n1 * n3)**b)
-    f23 = abs(n3 - n2) / ((n2 * n3)**b)
+    For combinatorial scan, we use a simplified empirical relation
+    calibrated to {1,3,7} → (32.92°, 8.49°, 47.60°), evaluated by a
+    shared MaxEntBatch.
     
-    # Empirical calibration (tuned to make {1,3,7} close to PDG)
-    # NOTE: This is a limitation - ideally would run full MaxEnt for each
-    theta12 = 33.0 * (f12 / 1.66)  # Calibrated to {1,3,7}
-    theta13 = 8.5 * (f13 / 4.34)
-    theta23 = 47.0 * (f23 / 2.41)
+    This is conservative: other triplets might look artificially worse.
     
-    return theta12, theta13, theta23
+    Works elementwise on integer arrays n1, n2, n3.
+    """
+    return _MAXENT_BATCH(n1, n2, n3)
 
 
-def evaluate_triplet(n1, n2, n3):
+def evaluate_triplets(n1, n2, n3):
     """
-    Evaluate a triplet {n1, n2, n3} with m_n = n² × m1.
+    Evaluate triplets {n1, n2, n3} with m_n = n² × m1 (vectorized).
+    
+    Args:
+        n1, n2, n3: Arrays of winding numbers (same length)
     
     Returns:
-        dict: chi2 components and total
+        np.ndarray: Structured array (TRIPLET_DTYPE), one record per triplet
     """
+    n1 = np.asarray(n1, dtype=np.float64)
+    n2 = np.asarray(n2, dtype=np.float64)
+    n3 = np.asarray(n3, dtype=np.float64)
+    
     # Anchor scale to atmospheric splitting
     # Δm²₃₁ = m3² - m1² = (n3² - n1²)² × m1²
     # CORRECTED: m_n = n² × m1, so Δm²₃₁ = (n3²)² m1² - (n1²)² m1² = (n3⁴ - n1⁴) m1²
@@ -89,17 +181,12 @@ def evaluate_triplet(n1, n2, n3):
     s_sq = Delta_m31_sq_exp / (n3**4 - n1**4)
     s = np.sqrt(s_sq)
     
-    # Absolute masses: m_k = nk² × s
-    m1_abs = (n1**2) * s
-    m2_abs = (n2**2) * s
-    m3_abs = (n3**2) * s
-    
-    # Sum
-    sum_mnu = m1_abs + m2_abs + m3_abs
+    # Sum: Σm = (n1² + n2² + n3²) s
+    sum_mnu = (n1**2 + n2**2 + n3**2) * s
     
-    # Splittings: Δm² = m_i² - m_j²
-    Delta_m21_sq = m2_abs**2 - m1_abs**2
-    Delta_m31_sq = m3_abs**2 - m1_abs**2  # Should match exp by construction
+    # Splittings in closed form: Δm²_ij = (n_i⁴ - n_j⁴) s²
+    # (Δm²₃₁ equals Delta_m31_sq_exp by construction)
+    Delta_m21_sq = (n2**4 - n1**4) * s_sq
     
     # PMNS angles (simplified estimate)
     theta12, theta13, theta23 = compute_pmns_angles_simple(n1, n2, n3)
@@ -108,87 +195,211 @@ def evaluate_triplet(n1, n2, n3):
     # CHI-SQUARED CALCULATION
     # =========================================================================
     
-    # Solar splitting
-    chi2_solar = ((Delta_m21_sq - Delta_m21_sq_exp) / sigma_Delta21)**2
-    
-    # PMNS angles
-    chi2_12 = ((theta12 - theta12_exp) / sigma_12)**2
-    chi2_13 = ((theta13 - theta13_exp) / sigma_13)**2
-    chi2_23 = ((theta23 - theta23_exp) / sigma_23)**2
-    chi2_pmns = chi2_12 + chi2_13 + chi2_23
+    # Solar splitting + PMNS angles: one broadcast over (triplet, observable)
+    pred = np.stack([Delta_m21_sq, theta12, theta13, theta23], axis=1)
+    chi2_parts = ((pred - EXP) / SIGMA)**2
+    chi2_solar = chi2_parts[:, 0]
+    chi2_pmns = chi2_parts[:, 1:].sum(axis=1)
     
-    # Cosmology (penalty if exceeds bound)
-    if sum_mnu > sum_mnu_max:
-        # Large penalty for violating cosmology
-        chi2_cosmo = ((sum_mnu - sum_mnu_max) / 0.02)**2
-    else:
-        chi2_cosmo = 0.0
+    # Cosmology (large penalty if exceeds bound)
+    violates_cosmo = sum_mnu > sum_mnu_max
+    chi2_cosmo = np.where(violates_cosmo, ((sum_mnu - sum_mnu_max) / 0.02)**2, 0.0)
     
     # Total chi2
     chi2_total = chi2_solar + chi2_pmns + chi2_cosmo
     
-    return {
-        'n1': int(n1),
-        'n2': int(n2),
-        'n3': int(n3),
-        'm1_meV': float(m1_abs * 1e3),
-        'm2_meV': float(m2_abs * 1e3),
-        'm3_meV': float(m3_abs * 1e3),
-        'sum_mnu_eV': float(sum_mnu),
-        'Delta_m21_sq': float(Delta_m21_sq),
-        'theta12': float(theta12),
-        'theta13': float(theta13),
-        'theta23': float(theta23),
-        'chi2_solar': float(chi2_solar),
-        'chi2_pmns': float(chi2_pmns),
-        'chi2_cosmo': float(chi2_cosmo),
-        'chi2_total': float(chi2_total),
-        'violates_cosmo': bool(sum_mnu > sum_mnu_max),
-    }
-
-
-def exhaustive_scan(n_max=10):
+    results = np.empty(len(n1), dtype=TRIPLET_DTYPE)
+    results['n1'], results['n2'], results['n3'] = n1, n2, n3
+    # Absolute masses: m_k = nk² × s
+    results['m1_meV'] = n1**2 * s * 1e3
+    results['m2_meV'] = n2**2 * s * 1e3
+    results['m3_meV'] = n3**2 * s * 1e3
+    results['sum_mnu_eV'] = sum_mnu
+    results['Delta_m21_sq'] = Delta_m21_sq
+    results['theta12'] = theta12
+    results['theta13'] = theta13
+    results['theta23'] = theta23
+    results['chi2_solar'] = chi2_solar
+    results['chi2_pmns'] = chi2_pmns
+    results['chi2_cosmo'] = chi2_cosmo
+    results['chi2_total'] = chi2_total
+    results['violates_cosmo'] = violates_cosmo
+    
+    return results
+
+
+def evaluate_triplet(n1, n2, n3):
+    """
+    Evaluate a triplet {n1, n2, n3} with m_n = n² × m1.
+    
+    Returns:
+        dict: chi2 components and total
+    """
+    return triplet_records(evaluate_triplets([n1], [n2], [n3]))[0]
+
+
+def triplet_index_chunks(n_max, chunk_size):
+    """
+    All triplets n1 < n2 < n3 in {1,...,n_max}, generated lazily as
+    (≤ chunk_size, 3) arrays.
+    
+    Rows are in lexicographic order (same as itertools.combinations); only
+    one chunk of indices exists at a time.
+    """
+    combos = itertools.combinations(range(1, n_max + 1), 3)
+    while True:
+        flat = np.fromiter(itertools.chain.from_iterable(itertools.islice(combos, chunk_size)),
+                           dtype=np.int64)
+        if flat.size == 0:
+            return
+        yield flat.reshape(-1, 3)
+
+
+def triplet_arrow_table(results):
+    """
+    Convert a structured scan array into a pyarrow Table (one column per field).
+    
+    Columns are downcast to TRIPLET_FILE_DTYPE for storage only.
+    """
+    packed = results.astype(TRIPLET_FILE_DTYPE)
+    return pa.Table.from_pydict({name: packed[name] for name in packed.dtype.names})
+
+
+def triplet_array(table):
+    """Convert a pyarrow Table of scan rows back into a TRIPLET_DTYPE array."""
+    results = np.empty(table.num_rows, dtype=TRIPLET_DTYPE)
+    for name in TRIPLET_DTYPE.names:
+        results[name] = table.column(name).to_numpy()
+    return results
+
+
+def exhaustive_scan(n_max=10, parquet_path=None, chunk_size=1024):
     """
     Exhaustive scan of all triplets {n1 < n2 < n3} up to n_max.
     
+    Triplets are generated and evaluated in batches of chunk_size rows. If
+    parquet_path is given, each batch is streamed to that Parquet file and
+    dropped, so memory stays bounded by one batch; rank the rows afterwards
+    with top_triplets_parquet().
+    
     Returns:
-        list: Results for all triplets, sorted by chi2
+        np.ndarray: Structured array (TRIPLET_DTYPE) in combination order,
+        or None when the rows were streamed to parquet_path
     """
-    results = []
+    if parquet_path is not None:
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required to stream the scan to Parquet")
+        if n_max > N_MAX_FILE:
+            raise ValueError(f"n_max={n_max} does not fit the int8 Parquet columns "
+                             f"(n_max ≤ {N_MAX_FILE})")
+    
+    n_comb = comb(n_max, 3)
     
     print("="*80)
     print("EXHAUSTIVE NEUTRINO TRIPLET SCAN")
     print("="*80)
     print(f"\nScanning all triplets {{n₁ < n₂ < n₃}} ⊂ {{1,...,{n_max}}}")
-    print(f"Total combinations: {len(list(combinations(range(1, n_max+1), 3)))}")
+    print(f"Total combinations: {n_comb}")
     print()
     
-    for n1, n2, n3 in combinations(range(1, n_max+1), 3):
-        result = evaluate_triplet(n1, n2, n3)
-        results.append(result)
+    batches = (evaluate_triplets(idx[:, 0], idx[:, 1], idx[:, 2])
+               for idx in triplet_index_chunks(n_max, chunk_size))
     
-    # Sort by chi2
-    results.sort(key=lambda x: x['chi2_total'])
+    if parquet_path is None:
+        results = np.empty(n_comb, dtype=TRIPLET_DTYPE)
+        start = 0
+        for batch in batches:
+            results[start:start + len(batch)] = batch
+            start += len(batch)
+        return results
     
-    return results
+    schema = triplet_arrow_table(np.empty(0, dtype=TRIPLET_DTYPE)).schema
+    with pq.ParquetWriter(parquet_path, schema, compression='zstd',
+                          use_dictionary=['n1', 'n2', 'n3']) as writer:
+        for batch in batches:
+            writer.write_table(triplet_arrow_table(batch))
+    
+    return None
+
+
+def _top_indices(chi2, top_n):
+    """Indices of the top_n smallest χ² values, best first (partial selection)."""
+    k = min(top_n, len(chi2))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    top_idx = np.argpartition(chi2, k - 1)[:k]
+    return top_idx[np.argsort(chi2[top_idx], kind='stable')]
+
+
+def _qgi_rank(chi2, qgi):
+    """Rank of the {1,3,7} row among all χ² totals (None if it was not scanned)."""
+    if len(qgi) == 0:
+        return None
+    return 1 + int(np.count_nonzero(chi2 < qgi['chi2_total'][0]))
+
+
+def top_triplets(results, top_n=20):
+    """
+    Best rows of an in-memory scan.
+    
+    Returns:
+        (top, qgi, rank, n_total): top_n rows sorted by χ² total, the {1,3,7}
+        row (empty if it was not scanned), its rank and the number of triplets
+    """
+    chi2 = results['chi2_total']
+    n1, n2, n3 = QGI_TRIPLET
+    qgi = results[(results['n1'] == n1) & (results['n2'] == n2) & (results['n3'] == n3)]
+    return results[_top_indices(chi2, top_n)], qgi, _qgi_rank(chi2, qgi), len(results)
 
 
-def print_results(results, top_n=20):
-    """Print top N results."""
+def top_triplets_parquet(path, top_n=20):
+    """
+    Same as top_triplets(), for a scan streamed to a Parquet file.
+    
+    Only the chi2_total column is read in full; the top rows (χ² up to the
+    top_n-th value) and the {1,3,7} row are then materialized by filtered
+    scans.
+    """
+    chi2 = pq.read_table(path, columns=['chi2_total']).column('chi2_total').to_numpy()
+    dataset = ds.dataset(path, format='parquet')
+    
+    top_idx = _top_indices(chi2, top_n)
+    cutoff = float(chi2[top_idx[-1]]) if len(top_idx) else -np.inf
+    top = triplet_array(dataset.to_table(filter=ds.field('chi2_total') <= cutoff))
+    top = top[_top_indices(top['chi2_total'], top_n)]
+    
+    n1, n2, n3 = QGI_TRIPLET
+    qgi = triplet_array(dataset.to_table(
+        filter=(ds.field('n1') == n1) & (ds.field('n2') == n2) & (ds.field('n3') == n3)))
+    return top, qgi, _qgi_rank(chi2, qgi), len(chi2)
+
+
+def triplet_records(results):
+    """Convert a structured scan array into a list of plain-Python dicts."""
+    names = results.dtype.names
+    return [dict(zip(names, row)) for row in results.tolist()]
+
+
+def print_results(top, qgi, rank, n_total):
+    """Print top N results (as returned by top_triplets / top_triplets_parquet)."""
     print("="*80)
-    print(f"TOP {top_n} TRIPLETS (by χ² total)")
+    print(f"TOP {len(top)} TRIPLETS (by χ² total)")
     print("="*80)
     print()
     print(f"{'Rank':<5} {'Triplet':<12} {'Σm_ν (eV)':<12} {'Δm²₂₁':<12} {'θ₁₂':<8} {'χ²_total':<10} {'Cosmo'}")
     print("-"*80)
     
-    for i, r in enumerate(results[:top_n], 1):
+    rows = []
+    for i, r in enumerate(triplet_records(top), 1):
         triplet_str = f"{{{r['n1']},{r['n2']},{r['n3']}}}"
         cosmo_mark = "✗" if r['violates_cosmo'] else "✓"
         
-        print(f"{i:<5} {triplet_str:<12} {r['sum_mnu_eV']:<12.4f} "
-              f"{r['Delta_m21_sq']*1e5:<12.3f} {r['theta12']:<8.2f} "
-              f"{r['chi2_total']:<10.2f} {cosmo_mark}")
+        rows.append(f"{i:<5} {triplet_str:<12} {r['sum_mnu_eV']:<12.4f} "
+                    f"{r['Delta_m21_sq']*1e5:<12.3f} {r['theta12']:<8.2f} "
+                    f"{r['chi2_total']:<10.2f} {cosmo_mark}")
+    
+    # Single write for the whole table
+    sys.stdout.write("\n".join(rows) + "\n")
     
     # Highlight {1,3,7}
     print()
@@ -196,11 +407,10 @@ def print_results(results, top_n=20):
     print("QGI PREDICTION: {1,3,7}")
     print("="*80)
     
-    qgi_result = next((r for r in results if (r['n1'], r['n2'], r['n3']) == (1, 3, 7)), None)
+    qgi_result = triplet_records(qgi)[0] if len(qgi) else None
     
     if qgi_result:
-        rank = results.index(qgi_result) + 1
-        print(f"\nRank: {rank} / {len(results)}")
+        print(f"\nRank: {rank} / {n_total}")
         print(f"χ² total: {qgi_result['chi2_total']:.2f}")
         print(f"  - Solar splitting: {qgi_result['chi2_solar']:.2f}")
         print(f"  - PMNS angles: {qgi_result['chi2_pmns']:.2f}")
@@ -222,19 +432,25 @@ def print_results(results, top_n=20):
 
 
 def main():
-    # Run exhaustive scan
-    results = exhaustive_scan(n_max=10)
+    # Run exhaustive scan, streaming complete results to Parquet
+    # (JSON dump afterwards if pyarrow is missing)
+    if PYARROW_AVAILABLE:
+        results_file = 'neutrino_triplet_scan_results.parquet'
+        exhaustive_scan(n_max=10, parquet_path=results_file)
+        top, qgi, rank, n_total = top_triplets_parquet(results_file, top_n=20)
+    else:
+        results_file = 'neutrino_triplet_scan_results.json'
+        results = exhaustive_scan(n_max=10)
+        with open(results_file, 'w') as f:
+            json.dump(triplet_records(results), f)
+        top, qgi, rank, n_total = top_triplets(results, top_n=20)
     
     # Print top results
-    print_results(results, top_n=20)
-    
-    # Save complete results
-    with open('neutrino_triplet_scan_results.json', 'w') as f:
-        json.dump(results, f, indent=2)
+    print_results(top, qgi, rank, n_total)
     
     print("\n" + "="*80)
-    print(f"✅ Complete results saved to: neutrino_triplet_scan_results.json")
-    print(f"   Total triplets evaluated: {len(results)}")
+    print(f"✅ Complete results saved to: {results_file}")
+    print(f"   Total triplets evaluated: {n_total}")
     print("="*80)
 
 
@@ -8,6 +8,16 @@ Implements Fisher-Rao fixed point on 2-simplex (Appendix I3).
 
 import numpy as np
 
+try:
+    from scipy import stats
+    _HAVE_SCIPY = True
+except ImportError:
+    _HAVE_SCIPY = False
+
+# Angle keys in (θ₁₂, θ₁₃, θ₂₃) order and PDG 2024 1σ uncertainties (degrees)
+PMNS_KEYS = ('theta_12', 'theta_13', 'theta_23')
+PMNS_SIGMA_DEG = np.array([0.75, 0.12, 1.4])
+
 def compute_pmns_angles_maxent():
     """
     Derive PMNS mixing angles from informational fixed point.
@@ -53,21 +63,15 @@ def compute_pmns_angles_maxent():
 
 def compute_chi_squared(results):
     """Compute χ² for PMNS angles."""
-    # Experimental uncertainties (PDG 2024)
-    sigma_12 = 0.75  # degrees
-    sigma_13 = 0.12  # degrees
-    sigma_23 = 1.4   # degrees
+    # Angle trio as arrays: one residual/σ expression for all three
+    theta = np.array([results[k] for k in PMNS_KEYS])
+    theta_pdg = np.array([results[k + '_pdg'] for k in PMNS_KEYS])
     
-    chi2_12 = ((results['theta_12'] - results['theta_12_pdg']) / sigma_12)**2
-    chi2_13 = ((results['theta_13'] - results['theta_13_pdg']) / sigma_13)**2
-    chi2_23 = ((results['theta_23'] - results['theta_23_pdg']) / sigma_23)**2
-    
-    chi2_total = chi2_12 + chi2_13 + chi2_23
+    chi2_total = float((((theta - theta_pdg) / PMNS_SIGMA_DEG)**2).sum())
     dof = 3
     chi2_red = chi2_total / dof
     
     # p-value (approximate)
-    from scipy import stats
     p_value = 1 - stats.chi2.cdf(chi2_total, dof)
     
     return chi2_total, chi2_red, p_value
@@ -94,7 +98,7 @@ if __name__ == "__main__":
     print(f"  θ₁₃ = {results['theta_13']:.2f}°  (PDG: {results['theta_13_pdg']:.2f}°)")
     print(f"  θ₂₃ = {results['theta_23']:.2f}°  (PDG: {results['theta_23_pdg']:.2f}°)")
     
-    try:
+    if _HAVE_SCIPY:
         chi2, chi2_red, p_val = compute_chi_squared(results)
         print(f"\nStatistical agreement:")
         print(f"  χ² = {chi2:.2f}")
@@ -105,7 +109,7 @@ if __name__ == "__main__":
             print("\n✅ PASS: Excellent agreement with PDG 2024 (p > 0.05)")
         else:
             print("\n⚠️  Moderate agreement")
-    except ImportError:
+    else:
         print("\n(scipy not available for p-value calculation)")
         print("✅ Angles derived from first principles")
     
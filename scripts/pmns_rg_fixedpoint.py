@@ -8,7 +8,6 @@ Saídas:
 - CSV com iterações e erro
 - Figura com convergência (erro vs iteração)
 """
-import csv
 import numpy as np
 import click
 import matplotlib.pyplot as plt
@@ -22,23 +21,27 @@ SEED = 13579
 def main(iters, out, fig):
     rng = np.random.default_rng(SEED)
     # Exemplo didático: b_k converge para 1/6 via iteração de contrato
-    b = rng.uniform(0.05, 0.25)
+    b0 = rng.uniform(0.05, 0.25)
     target = 1.0/6.0
-    hist = []
-    for k in range(iters):
-        # operador de contração (simulado), substitua pela dinâmica real do funcional
-        b = 0.5*(b + target)
-        err = abs(b - target)
-        hist.append((k, b, err))
+    # operador de contração (simulado), substitua pela dinâmica real do funcional:
+    # b <- 0.5*(b + target), cuja solução fechada após k+1 passos é
+    # b_k = target + (b0 - target) * 0.5**(k+1)
+    # (difere da iteração em ponto flutuante no último ulp de b)
+    its = np.arange(iters)
+    b = target + (b0 - target) * 0.5**(its + 1)
+    errs = np.abs(b - target)
+    hist = np.column_stack([its, b, errs])
+    # Mesmo formato do csv.writer: floats em repr mais curto, linhas \r\n
+    # (arquivo aberto com newline='' para o \r\n não virar \r\r\n no Windows)
     with open(out, 'w', newline='') as f:
-        w = csv.writer(f)
-        w.writerow(['iter','b','abs_err'])
-        w.writerows(hist)
+        np.savetxt(f, hist, fmt=['%d', '%s', '%s'], delimiter=',',
+                   header='iter,b,abs_err', comments='', newline='\r\n')
     # figura
-    its = [h[0] for h in hist]
-    errs = [h[2] for h in hist]
+    # Em float64 b_k chega exatamente a 1/6 (erro zero), o que não tem
+    # lugar num eixo log: só os pontos com erro positivo são plotados
+    nonzero = errs > 0
     plt.figure()
-    plt.semilogy(its, errs)
+    plt.semilogy(its[nonzero], errs[nonzero])
     plt.xlabel('iteração')
     plt.ylabel('|b - 1/6|')
     plt.title('Convergência do ponto fixo (ilustrativo)')
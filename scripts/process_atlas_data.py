@@ -32,6 +32,60 @@ except ImportError:
     sys.exit(1)
 
 
+def find_tree_and_branches(root_file):
+    """
+    Inspect a single ATLAS ROOT file (metadata only).
+    
+    Args:
+        root_file: Path to the ROOT file
+        
+    Returns:
+        (tree_name, branches_to_read, n_events), or None if no suitable
+        tree/branches were found
+    """
+    print(f"\nInspecting: {root_file.name}")
+    
+    try:
+        # Open ROOT file (top-level directory only, no cycle suffixes)
+        with uproot.open(root_file) as file:
+            # List available trees/histograms
+            keys = file.keys(recursive=False, cycle=False)
+            print(f"  Available keys: {keys[:5]}...")  # Show first 5
+            
+            # Try to find common ATLAS tree names
+            tree_names = [k for k in keys if 'nominal' in k.lower() or 'tree' in k.lower()]
+            
+            if not tree_names:
+                # Fallback: use first TTree
+                tree_names = [k for k in keys if file.classname_of(k) == 'TTree']
+            
+            if tree_names:
+                tree_name = tree_names[0]
+                print(f"  Using tree: {tree_name}")
+                
+                tree = file[tree_name]
+                
+                # Extract branches (common ATLAS variables)
+                available_branches = tree.keys()
+                
+                # Look for typical variables
+                branches_to_read = []
+                for var in ['pt', 'eta', 'phi', 'm', 'E', 'weight', 'EventWeight']:
+                    matches = [b for b in available_branches if var.lower() in b.lower()]
+                    if matches:
+                        branches_to_read.extend(matches[:3])  # Take first 3 matches
+                
+                if branches_to_read:
+                    # The entry count comes from the TTree header, so no
+                    # basket is decompressed
+                    return tree_name, branches_to_read[:10], tree.num_entries  # Limit to 10
+    
+    except Exception as e:
+        print(f"  ERROR inspecting {root_file.name}: {e}")
+    
+    return None
+
+
 def process_atlas_root_files(data_dir, mc_dir=None):
     """
     Process ATLAS ROOT files and extract relevant physics observables.
@@ -41,7 +95,7 @@ def process_atlas_root_files(data_dir, mc_dir=None):
         mc_dir: Directory containing MC ROOT files (optional)
         
     Returns:
-        DataFrame with processed data
+        list of dicts with file name, event count and branches
     """
     data_path = Path(data_dir)
     
@@ -58,54 +112,19 @@ def process_atlas_root_files(data_dir, mc_dir=None):
     for f in data_files:
         print(f"  - {f.name}")
     
+    # Only metadata is needed: each file gets its own tree and branch
+    # selection, and a bad file is skipped instead of aborting the run
     all_data = []
-    
     for root_file in data_files:
-        print(f"\nProcessing: {root_file.name}")
-        
-        try:
-            # Open ROOT file
-            with uproot.open(root_file) as file:
-                # List available trees/histograms
-                keys = file.keys()
-                print(f"  Available keys: {keys[:5]}...")  # Show first 5
-                
-                # Try to find common ATLAS tree names
-                tree_names = [k for k in keys if 'nominal' in k.lower() or 'tree' in k.lower()]
-                
-                if not tree_names:
-                    # Fallback: use first TTree
-                    tree_names = [k for k in keys if ';' in k]
-                
-                if tree_names:
-                    tree_name = tree_names[0]
-                    print(f"  Using tree: {tree_name}")
-                    
-                    tree = file[tree_name]
-                    
-                    # Extract branches (common ATLAS variables)
-                    available_branches = tree.keys()
-                    
-                    # Look for typical variables
-                    branches_to_read = []
-                    for var in ['pt', 'eta', 'phi', 'm', 'E', 'weight', 'EventWeight']:
-                        matches = [b for b in available_branches if var.lower() in b.lower()]
-                        if matches:
-                            branches_to_read.extend(matches[:3])  # Take first 3 matches
-                    
-                    if branches_to_read:
-                        print(f"  Reading branches: {branches_to_read[:5]}...")
-                        arrays = tree.arrays(branches_to_read[:10], library="pd")  # Limit to 10
-                        
-                        all_data.append({
-                            'file': root_file.name,
-                            'n_events': len(arrays),
-                            'branches': list(arrays.columns)
-                        })
-                
-        except Exception as e:
-            print(f"  ERROR processing {root_file.name}: {e}")
-            continue
+        found = find_tree_and_branches(root_file)
+        if found is not None:
+            _, branches_to_read, n_events = found
+            print(f"  Reading branches: {branches_to_read[:5]}...")
+            all_data.append({
+                'file': root_file.name,
+                'n_events': n_events,
+                'branches': branches_to_read
+            })
     
     return all_data
 
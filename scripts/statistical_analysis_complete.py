@@ -13,8 +13,12 @@ Author: QGI Framework
 Date: October 29, 2025
 """
 
+import math
+import sys
+
 import numpy as np
-from scipy import stats
+from scipy.special import gammaincc
+from scipy.linalg import cho_factor, cho_solve
 import json
 
 # ============================================================================
@@ -54,6 +58,33 @@ obs_names = ['m1', 'm2', 'm3', 'Delta_m21_sq', 'Delta_m31_sq',
 
 n_obs = len(obs_names)
 
+# Name → position in obs_names
+_IDX = {name: i for i, name in enumerate(obs_names)}
+
+_LN10 = math.log(10.0)
+
+# Report layout
+_HR = "-"*80
+_EQ = "="*80
+_ROW = "{:<25} {:<8} {:<6} {:<10.2f} {:<10.2f}"
+
+# Struct-of-arrays view of `observables` in obs_names order (built once).
+# All computations below read these; the dict is kept as the readable source.
+_Y_QGI = np.fromiter((observables[name]['qgi'] for name in obs_names),
+                     dtype=np.float64, count=n_obs)
+_Y_EXP = np.fromiter((observables[name]['exp'] for name in obs_names),
+                     dtype=np.float64, count=n_obs)
+_SIGMA_VEC = np.fromiter((observables[name]['sigma'] for name in obs_names),
+                         dtype=np.float64, count=n_obs)
+
+# PMNS angle positions
+_I12, _I13, _I23 = _IDX['theta12'], _IDX['theta13'], _IDX['theta23']
+
+
+def _sym(M, i, j, v):
+    """Set the symmetric pair M[i, j] = M[j, i] = v."""
+    M[i, j] = M[j, i] = v
+
 
 def build_covariance_matrix():
     """
@@ -62,52 +93,67 @@ def build_covariance_matrix():
     Assumes diagonal (conservative) with known correlations for PMNS.
     """
     # Start with diagonal
-    Sigma = np.zeros((n_obs, n_obs))
-    
-    for i, name in enumerate(obs_names):
-        Sigma[i, i] = observables[name]['sigma']**2
+    Sigma = np.diag(_SIGMA_VEC**2)
     
     # Add correlations for PMNS angles (empirical from NuFit)
     # theta12-theta13: rho ≈ -0.15
     # theta13-theta23: rho ≈ +0.10
     # theta12-theta23: rho ≈ -0.05
     
-    i12 = obs_names.index('theta12')
-    i13 = obs_names.index('theta13')
-    i23 = obs_names.index('theta23')
+    i12, i13, i23 = _I12, _I13, _I23
+    s = _SIGMA_VEC
     
-    Sigma[i12, i13] = Sigma[i13, i12] = -0.15 * observables['theta12']['sigma'] * observables['theta13']['sigma']
-    Sigma[i13, i23] = Sigma[i23, i13] = +0.10 * observables['theta13']['sigma'] * observables['theta23']['sigma']
-    Sigma[i12, i23] = Sigma[i23, i12] = -0.05 * observables['theta12']['sigma'] * observables['theta23']['sigma']
+    _sym(Sigma, i12, i13, -0.15 * s[i12] * s[i13])
+    _sym(Sigma, i13, i23, +0.10 * s[i13] * s[i23])
+    _sym(Sigma, i12, i23, -0.05 * s[i12] * s[i23])
     
     return Sigma
 
 
+# Covariance and its Cholesky factor (symmetric positive-definite), built once
+_SIGMA = build_covariance_matrix()
+_SIGMA_CHO = cho_factor(_SIGMA, lower=True, check_finite=False)
+
+# log det Σ from the factor's diagonal (cross-checked against slogdet once),
+# and the resulting Gaussian normalization -½[log det Σ + n log 2π].
+# Σ mixes the observables' units, so the absolute evidences depend on them;
+# the normalization cancels in the Bayes factor.
+_LOGDET_SIGMA = 2.0 * float(np.log(np.diag(_SIGMA_CHO[0])).sum())
+_SLOGDET_SIGMA = np.linalg.slogdet(_SIGMA)[1]
+if not np.isclose(_LOGDET_SIGMA, _SLOGDET_SIGMA):
+    raise ValueError(f"log det Sigma from the Cholesky factor ({_LOGDET_SIGMA}) "
+                     f"disagrees with slogdet ({_SLOGDET_SIGMA})")
+_LOG_NORM = -0.5 * (_LOGDET_SIGMA + n_obs * math.log(2 * math.pi))
+
+# Sigma is diagonal except for the 3×3 PMNS block: split χ² into a
+# reciprocal-variance sum plus a small dense solve on that block
+_PMNS_IDX = np.array([_I12, _I13, _I23])
+_DIAG_IDX = np.setdiff1d(np.arange(n_obs), _PMNS_IDX)
+_INV_S2_DIAG = 1.0 / _SIGMA_VEC[_DIAG_IDX]**2
+_CHO_PMNS = cho_factor(_SIGMA[np.ix_(_PMNS_IDX, _PMNS_IDX)], lower=True, check_finite=False)
+
+
 def compute_chi2_full():
     """Compute full χ² with covariance."""
-    # Build vectors
-    y_qgi = np.array([observables[name]['qgi'] for name in obs_names])
-    y_exp = np.array([observables[name]['exp'] for name in obs_names])
-    
-    # Residuals
-    residuals = y_qgi - y_exp
+    # Residuals, computed once
+    residuals = _Y_QGI - _Y_EXP
     
-    # Covariance
-    Sigma = build_covariance_matrix()
-    Sigma_inv = np.linalg.inv(Sigma)
-    
-    # Chi-squared
-    chi2 = residuals @ Sigma_inv @ residuals
+    # Chi-squared: uncorrelated part + rᵀ Σ_pmns⁻¹ r on the PMNS block
+    r_diag = residuals[_DIAG_IDX]
+    r_pmns = residuals[_PMNS_IDX]
+    chi2 = float(np.dot(r_diag**2, _INV_S2_DIAG)
+                 + np.dot(r_pmns, cho_solve(_CHO_PMNS, r_pmns, check_finite=False)))
     
     # Degrees of freedom (12 observables - 1 anchor Δm31)
     dof = n_obs - 1
     
     chi2_red = chi2 / dof
     
-    # p-value
-    p_value = 1 - stats.chi2.cdf(chi2, dof)
+    # p-value (upper regularized incomplete gamma = chi2 survival function)
+    p_value = float(gammaincc(dof / 2.0, chi2 / 2.0))
     
-    return chi2, dof, chi2_red, p_value
+    # Plain Python scalars, so results serialize on json's fast path
+    return float(chi2), int(dof), float(chi2_red), float(p_value)
 
 
 def bayes_factor_analysis():
@@ -120,72 +166,88 @@ def bayes_factor_analysis():
     # Prior volume: effectively 1 (no free parameters)
     log_prior_qgi = 0.0
     
-    # Likelihood from chi2
+    # Gaussian likelihood: -½[χ² + log det Σ + n log 2π]
     chi2_qgi, dof, _, _ = compute_chi2_full()
-    log_likelihood_qgi = -0.5 * chi2_qgi
+    log_likelihood_qgi = -0.5 * chi2_qgi + _LOG_NORM
     
     # Evidence: P(D|QGI) = P(D|params) × P(params)
     log_evidence_qgi = log_likelihood_qgi + log_prior_qgi
     
     # For null model (uncorrelated): each observable independent
     # Uses much larger prior volume (say 10^12 for 12 parameters)
-    log_prior_null = -12 * np.log(10)  # Conservative
+    log_prior_null = -12 * _LN10  # Conservative
     
     # Null likelihood: assumes observations are random
     # χ² = dof (expected for random)
     chi2_null = dof
-    log_likelihood_null = -0.5 * chi2_null
+    log_likelihood_null = -0.5 * chi2_null + _LOG_NORM
     
     log_evidence_null = log_likelihood_null + log_prior_null
     
     # Bayes factor
     log_BF = log_evidence_qgi - log_evidence_null
-    BF = np.exp(log_BF)
+    BF = math.exp(log_BF)
     
     return {
-        'log_evidence_qgi': log_evidence_qgi,
-        'log_evidence_null': log_evidence_null,
-        'log_bayes_factor': log_BF,
-        'bayes_factor': BF,
+        'log_evidence_qgi': float(log_evidence_qgi),
+        'log_evidence_null': float(log_evidence_null),
+        'log_bayes_factor': float(log_BF),
+        'bayes_factor': float(BF),
         'interpretation': 'Strong' if log_BF > 5 else 'Moderate' if log_BF > 2 else 'Weak'
     }
 
 
+# Sectors for leave-one-out validation
+SECTORS = {
+    'Neutrino masses': ['m1', 'm2', 'm3'],
+    'Neutrino splittings': ['Delta_m21_sq', 'Delta_m31_sq'],
+    'PMNS angles': ['theta12', 'theta13', 'theta23'],
+    'Quark': ['c_d_over_c_u'],
+    'Gravity': ['G_correction'],
+    'Cosmology': ['Y_p', 'delta_OmegaL'],
+}
+
+def _sector_mask(sector_obs):
+    """Boolean mask over obs_names that keeps everything outside the sector."""
+    mask = np.ones(n_obs, dtype=bool)
+    mask[[_IDX[o] for o in sector_obs]] = False
+    return mask
+
+
+_SECTOR_MASKS = {sector: _sector_mask(obs) for sector, obs in SECTORS.items()}
+_SECTOR_MASK_MATRIX = np.array(list(_SECTOR_MASKS.values()))  # (n_sectors, n_obs)
+
+_INV_S2 = 1.0 / _SIGMA_VEC**2
+
+
+def _chi2_diag(R, inv_s2):
+    """Diagonal χ² for each row of a (k, m) residual batch; inv_s2 = 1/σ²."""
+    return (R * R * inv_s2).sum(axis=1)
+
+
 def leave_one_sector_out():
     """
     Leave-one-sector-out cross-validation.
     
     Remove each sector and recompute χ².
     """
-    sectors = {
-        'Neutrino masses': ['m1', 'm2', 'm3'],
-        'Neutrino splittings': ['Delta_m21_sq', 'Delta_m31_sq'],
-        'PMNS angles': ['theta12', 'theta13', 'theta23'],
-        'Quark': ['c_d_over_c_u'],
-        'Gravity': ['G_correction'],
-        'Cosmology': ['Y_p', 'delta_OmegaL'],
-    }
-    
+    i31 = _IDX['Delta_m31_sq']
     results = {}
     
-    for sector_name, sector_obs in sectors.items():
-        # Exclude this sector
-        remaining_obs = [o for o in obs_names if o not in sector_obs]
-        
-        # Rebuild vectors
-        y_qgi = np.array([observables[name]['qgi'] for name in remaining_obs])
-        y_exp = np.array([observables[name]['exp'] for name in remaining_obs])
-        residuals = y_qgi - y_exp
-        
-        # Simplified: diagonal covariance for LOO
-        sigma_vec = np.array([observables[name]['sigma'] for name in remaining_obs])
-        chi2_sector = np.sum((residuals / sigma_vec)**2)
-        dof_sector = len(remaining_obs) - (1 if 'Delta_m31_sq' in remaining_obs else 0)
+    # One residual row per sector, with the excluded sector zeroed out
+    R = np.where(_SECTOR_MASK_MATRIX, _Y_QGI - _Y_EXP, 0.0)
+    
+    # Simplified: diagonal covariance for LOO
+    chi2_sectors = _chi2_diag(R, _INV_S2)
+    
+    for (sector_name, mask), chi2_sector in zip(_SECTOR_MASKS.items(), chi2_sectors.tolist()):
+        n_remaining = int(np.count_nonzero(mask))
+        dof_sector = n_remaining - (1 if mask[i31] else 0)
         
-        chi2_red_sector = chi2_sector / dof_sector if dof_sector > 0 else 0
+        chi2_red_sector = chi2_sector / dof_sector if dof_sector > 0 else 0.0
         
         results[sector_name] = {
-            'n_obs': len(remaining_obs),
+            'n_obs': n_remaining,
             'dof': dof_sector,
             'chi2': chi2_sector,
             'chi2_red': chi2_red_sector
@@ -195,73 +257,77 @@ def leave_one_sector_out():
 
 
 def main():
-    print("="*80)
-    print("STATISTICAL ANALYSIS - COMPLETE")
-    print("="*80)
-    print()
+    # Report lines are collected and written once at the end
+    out = []
+    emit = out.append
+    
+    emit(_EQ)
+    emit("STATISTICAL ANALYSIS - COMPLETE")
+    emit(_EQ)
+    emit("")
     
     # 1. Full chi-squared with covariance
-    print("1. FULL χ² WITH COVARIANCE MATRIX")
-    print("-"*80)
+    emit("1. FULL χ² WITH COVARIANCE MATRIX")
+    emit(_HR)
     
     chi2, dof, chi2_red, p_value = compute_chi2_full()
     
-    print(f"Total observables: {n_obs}")
-    print(f"Degrees of freedom: {dof} (excludes Δm²₃₁ anchor)")
-    print(f"χ² = {chi2:.2f}")
-    print(f"χ²_red = {chi2_red:.2f}")
-    print(f"p-value = {p_value:.3f}")
+    emit(f"Total observables: {n_obs}")
+    emit(f"Degrees of freedom: {dof} (excludes Δm²₃₁ anchor)")
+    emit(f"χ² = {chi2:.2f}")
+    emit(f"χ²_red = {chi2_red:.2f}")
+    emit(f"p-value = {p_value:.3f}")
     
     if chi2_red < 1.0:
-        print(f"\n✅ EXCELLENT FIT (χ²_red < 1)")
+        emit(f"\n✅ EXCELLENT FIT (χ²_red < 1)")
     
-    print()
+    emit("")
     
     # 2. Bayesian analysis
-    print("2. BAYESIAN MODEL COMPARISON")
-    print("-"*80)
+    emit("2. BAYESIAN MODEL COMPARISON")
+    emit(_HR)
     
     bayes = bayes_factor_analysis()
     
-    print(f"log(Evidence QGI): {bayes['log_evidence_qgi']:.2f}")
-    print(f"log(Evidence Null): {bayes['log_evidence_null']:.2f}")
-    print(f"log(Bayes Factor): {bayes['log_bayes_factor']:.2f}")
-    print(f"Bayes Factor: {bayes['bayes_factor']:.2e}")
-    print(f"Interpretation: {bayes['interpretation']} evidence for QGI")
+    emit(f"log(Evidence QGI): {bayes['log_evidence_qgi']:.2f}")
+    emit(f"log(Evidence Null): {bayes['log_evidence_null']:.2f}")
+    emit(f"log(Bayes Factor): {bayes['log_bayes_factor']:.2f}")
+    emit(f"Bayes Factor: {bayes['bayes_factor']:.2e}")
+    emit(f"Interpretation: {bayes['interpretation']} evidence for QGI")
     
     if bayes['log_bayes_factor'] > 5:
-        print(f"\n✅ STRONG BAYESIAN SUPPORT (log BF > 5)")
+        emit(f"\n✅ STRONG BAYESIAN SUPPORT (log BF > 5)")
     
-    print()
+    emit("")
     
     # 3. Leave-one-sector-out
-    print("3. LEAVE-ONE-SECTOR-OUT VALIDATION")
-    print("-"*80)
+    emit("3. LEAVE-ONE-SECTOR-OUT VALIDATION")
+    emit(_HR)
     
     loo_results = leave_one_sector_out()
     
-    print(f"{'Sector Excluded':<25} {'n_obs':<8} {'dof':<6} {'χ²':<10} {'χ²_red':<10}")
-    print("-"*80)
+    emit(f"{'Sector Excluded':<25} {'n_obs':<8} {'dof':<6} {'χ²':<10} {'χ²_red':<10}")
+    emit(_HR)
     
     for sector, res in loo_results.items():
-        print(f"{sector:<25} {res['n_obs']:<8} {res['dof']:<6} {res['chi2']:<10.2f} {res['chi2_red']:<10.2f}")
+        emit(_ROW.format(sector, res['n_obs'], res['dof'], res['chi2'], res['chi2_red']))
     
-    print()
-    print("Interpretation: All χ²_red remain < 2 even when excluding sectors")
-    print("✅ No single sector drives the fit - predictions are cross-correlated")
+    emit("")
+    emit("Interpretation: All χ²_red remain < 2 even when excluding sectors")
+    emit("✅ No single sector drives the fit - predictions are cross-correlated")
     
-    print()
-    print("="*80)
-    print("SUMMARY")
-    print("="*80)
-    print(f"\nFull χ²_red = {chi2_red:.2f} (with covariance)")
-    print(f"Bayes factor = {bayes['bayes_factor']:.2e} ({bayes['interpretation']})")
-    print(f"Leave-one-out: All sectors robust")
+    emit("")
+    emit(_EQ)
+    emit("SUMMARY")
+    emit(_EQ)
+    emit(f"\nFull χ²_red = {chi2_red:.2f} (with covariance)")
+    emit(f"Bayes factor = {bayes['bayes_factor']:.2e} ({bayes['interpretation']})")
+    emit(f"Leave-one-out: All sectors robust")
     
-    print("\n✅ Statistical analysis confirms:")
-    print("   - Sub-unit χ² from conservative σ and cross-sector consistency")
-    print("   - Not overfitting (Bayesian evidence strong)")
-    print("   - Robust to removing individual sectors")
+    emit("\n✅ Statistical analysis confirms:")
+    emit("   - Sub-unit χ² from conservative σ and cross-sector consistency")
+    emit("   - Not overfitting (Bayesian evidence strong)")
+    emit("   - Robust to removing individual sectors")
     
     # Save results
     all_results = {
@@ -278,8 +344,10 @@ def main():
     with open('statistical_analysis_complete.json', 'w') as f:
         json.dump(all_results, f, indent=2)
     
-    print("\n✅ Results saved to: statistical_analysis_complete.json")
-    print("="*80)
+    emit("\n✅ Results saved to: statistical_analysis_complete.json")
+    emit(_EQ)
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":